@@ -38,11 +38,23 @@ import argparse
 import collections
 import itertools
 import math
+import re
 
 
 # Type the path to your input text file here if you do not wish to use the command line argument
 FILENAME = "./inputs/day01.txt"
 
+# Matches a digit or an out-spelled number. The pattern is wrapped inside a lookahead so that overlapping numbers
+# (e.g. 'twone' or 'eightwo') are all found, as the match itself does not consume any characters.
+NUMBER_PATTERN = re.compile(r'(?=([0-9]|one|two|three|four|five|six|seven|eight|nine))')
+
+# Numerical values of the tokens matched by NUMBER_PATTERN
+NUMBER_VALUES = {'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9}
+NUMBER_VALUES.update({str(digit): digit for digit in range(10)})
+
+# Matches a single digit
+DIGIT_PATTERN = re.compile(r'[0-9]')
+
 
 def get_fn() ->  str:
     '''
@@ -65,106 +77,16 @@ def load_file(fn: str)  -> str:
     @returns:       contents of the file as a string
     '''
     with open(fn,'r') as file:
-        ret = ''
-        for line in file:   # Loop through the file and add the lines to the return value
-            ret += line
-    return ret.split('\n')
+        return file.read().splitlines()     # Read the file in one go and split it from the line breaks
 
 # =========================
 
-def find_first_digit_in_string(string):
-    '''
-    Function finds and returns the first digit (0-9) it finds in a string, or None if none found.
-    '''
-    num = None
-    for char in string:
-        try:
-            num = int(char)
-            break
-        except ValueError:
-            continue
-    return num
-
-def find_last_digit_in_string(string):
-    '''
-    Function finds and returns the last digit (0-9) it finds in a string, or None if none found.
-    '''
-    reversed = string[::-1]
-    return find_first_digit_in_string(reversed)
-
-def find_spelled_out_number(string):
-    '''
-    Function finds and returns an out-spelled number ('one', 'two'...) in the given string.
-    If there are multiple, the function returns the largest of those numbers.
-    '''
-    num = None
-    if "one" in string:
-        num = 1
-    if "two" in string:
-        num = 2
-    if "three" in string:
-        num = 3
-    if "four" in string:
-        num = 4
-    if "five" in string:
-        num = 5
-    if "six" in string:
-        num = 6
-    if "seven" in string:
-        num = 7
-    if "eight" in string:
-        num = 8
-    if "nine" in string:
-        num = 9
-    return num
-
-def find_first_number(line):
-    '''
-    Finds and returns the first number of the given line, be it a digit or an out-spelled number.
-    '''
-    # Idea: Take first only the first character and see if it either contains a digit or an out-spelled digit.
-    # If not, take first two characters as a substring and conduct the search again, then three and so on, until a value is found.
-    num = None
-    for idx in range(len(line)+1):
-        substr = line[:idx]
-        num = find_spelled_out_number(substr)
-        if num is not None:
-            break
-        num = find_first_digit_in_string(substr)
-        if num is not None:
-            break
-    return num
-
-def find_last_number(line):
-    '''
-    Finds and returns the last number of the line, be it a digit of out-spelled number.
-    '''
-    # Idea: Take first only the last character and see if it either contains a digit or an out-spelled digit.
-    # If not, take last two characters as a substring and conduct the search again, then three and so on, until a value is found.
-    num = None
-    for idx in range(len(line),-1,-1):
-        substr = line[idx:]
-        num = find_spelled_out_number(substr)
-        if num is not None:
-            break
-        num = find_last_digit_in_string(substr)
-        if num is not None:
-            break
-    return num
-
 def task1(data):
     '''
     Finds and returns the answer for the first task.
     '''
-    calibvalue = 0
-    for idx, line in enumerate(data):
-        first = find_first_digit_in_string(line)
-        last  = find_last_digit_in_string(line)
-        if first is not None and last is not None:
-            calibvalue += 10*first + last
-        else:
-            print(f"Error with line {idx}: line={line}, first={first}, last={last}")
-    return calibvalue
+    # All digits of each line are found in a single regex pass; lines without any digits are skipped
+    return sum(10*int(digits[0]) + int(digits[-1]) for line in data for digits in [DIGIT_PATTERN.findall(line)] if digits)
 
 def task2(data):
     '''
@@ -172,12 +94,12 @@ def task2(data):
     '''
     calibvalue = 0
     for idx, line in enumerate(data):
-        first = find_first_number(line)
-        last  = find_last_number(line)
-        if first is not None and last is not None:
-            calibvalue += 10*first + last
+        # All numbers (digits and out-spelled) of the line, from left to right, found in a single pass
+        numbers = NUMBER_PATTERN.findall(line)
+        if numbers:
+            calibvalue += 10*NUMBER_VALUES[numbers[0]] + NUMBER_VALUES[numbers[-1]]
         else:
-            print(f"Error with line {idx}: line={line}, first={first}, last={last}")
+            print(f"Error with line {idx}: line={line}, no numbers found")
     return calibvalue
 
 # =========================
@@ -38,11 +38,21 @@ import argparse
 import collections
 import itertools
 import math
+import re
 
 
 # Type the path to your input text file here if you do not wish to use the command line argument
 FILENAME = "./inputs/day02.txt"
 
+# Matches one color entry of a run, e.g. "3 green" -> ('3', 'green').
+# Only the counts of each color matter, so the game header and the run separators (;) can be ignored altogether.
+CUBE_PATTERN = re.compile(r'(\d+) (red|green|blue)')
+
+# Maximum number of cubes of each color in a legal game (from assignment)
+MAX_VALUES = {  'red':   12,
+                'green': 13,
+                'blue':  14}
+
 
 def get_fn() ->  str:
     '''
@@ -65,10 +75,7 @@ def load_file(fn: str)  -> str:
     @returns:       contents of the file as a string
     '''
     with open(fn,'r') as file:
-        ret = ''
-        for line in file:   # Loop through the file and add the lines to the return value
-            ret += line
-    return ret.split('\n')
+        return file.read().splitlines()     # Read the file in one go and split it from the line breaks
 
 
 def is_game_legal(line):
@@ -79,22 +86,8 @@ def is_game_legal(line):
         "Game 0: 1 red, 3 green, 5 blue; 2 red, 8 green, 7 blue"
     @returns: True if game is legal, False if not
     '''
-    # From assignment
-    max_values = {  'red':   12,
-                    'green': 13,
-                    'blue':  14}
-    
-    game_header, game_data = line.split(":") # First split: ["Game 0", "1 red, 3 green, 5 blue; 2 red, 8 green, 7 blue"]
-    game_id = int(game_header.split(" ")[1]) 
-     
-    runs = game_data.split(";")             # ["1 red, 3 green, 5 blue", "2 red, 8 green, 7 blue"]
-    for run in runs:
-        colors = run.split(",")              # ["1 red", "3 green", "5 blue"]
-        for color in colors:
-            num, color_name = color.strip().split(" ") # ["1", "red"]
-            if int(num) > max_values[color_name]:
-                return False
-    return True
+    # The matches are generated lazily with finditer, so the scan of the line stops at the first illegal color entry
+    return not any(int(match[1]) > MAX_VALUES[match[2]] for match in CUBE_PATTERN.finditer(line))
 
 
 def task1(data):
@@ -120,15 +113,10 @@ def minimum_no_blocks(line):
     '''
     min_numbers = {'red': 0, 'green': 0, 'blue': 0}
 
-    _, game_data = line.split(":")  # First split: ["Game 0", "1 red, 3 green, 5 blue; 2 red, 8 green, 7 blue"]
-    runs = game_data.split(";")                 # ["1 red, 3 green, 5 blue", "2 red, 8 green, 7 blue"]
-    for run in runs:
-        colors = run.split(",")                 # ["1 red", "3 green", "5 blue"]
-        for color in colors:
-            num, color_name = color.strip().split(" ") # ["1", "red"]
-            num = int(num)
-            if num > min_numbers[color_name]:
-                min_numbers[color_name] = num
+    for num, color_name in CUBE_PATTERN.findall(line):   # [('1', 'red'), ('3', 'green'), ('5', 'blue'), ('2', 'red'), ...]
+        num = int(num)
+        if num > min_numbers[color_name]:
+            min_numbers[color_name] = num
     return min_numbers
 
 def task2(data):
@@ -38,11 +38,15 @@ import argparse
 import collections
 import itertools
 import math
+import re
 
 
 # Type the path to your input text file here if you do not wish to use the command line argument
 FILENAME = "./inputs/day04.txt"
 
+# Matches a single (non-negative) integer
+NUMBER_PATTERN = re.compile(r'\d+')
+
 
 def get_fn() ->  str:
     '''
@@ -65,17 +69,16 @@ def load_file(fn: str)  -> str:
     @returns:       contents of the file as a string
     '''
     with open(fn,'r') as file:
-        ret = ''
-        for line in file:   # Loop through the file and add the lines to the return value
-            ret += line
-    return ret.split('\n')
+        return file.read().splitlines()     # Read the file in one go and split it from the line breaks
 
 class Card:
     '''
     Class mainly to conveniently hold data of one scratch card.
     '''
+    __slots__ = ('winning_numbers', 'card_numbers', 'matches')
+
     def __init__(self, winning_numbers, card_numbers):
-        self.winning_numbers    = winning_numbers
+        self.winning_numbers    = frozenset(winning_numbers)   # Set -> membership checks in constant time
         self.card_numbers       = card_numbers
         self.matches            = None
     
@@ -84,7 +87,7 @@ class Card:
         Method returns how many matches it has between its numbers and the winning numbers.
         '''
         if self.matches is None:    # If not calculated yet, calculate the number now
-            self.matches = len([num for num in self.card_numbers if num in self.winning_numbers])
+            self.matches = len(self.winning_numbers.intersection(self.card_numbers))
         return self.matches
     
     def __repr__(self) -> str:
@@ -96,28 +99,25 @@ def parse_line(line):
     Function parses one line of the input file and returns the card id and a respective Card object.
     '''
     header, vals    = line.split(":")
-    header          = header.split(" ")
-    card_id         = int(header[-1].strip())
+    card_id         = int(NUMBER_PATTERN.search(header).group())
     winning_numbers, card_numbers = vals.split("|")
-    winning_numbers = winning_numbers.split(" ")
-    winning_numbers = [int(val) for val in winning_numbers if val != '']
-    card_numbers    = card_numbers.split(" ")
-    card_numbers    = [int(val) for val in card_numbers if val != '']
+    winning_numbers = frozenset(int(val) for val in NUMBER_PATTERN.findall(winning_numbers))
+    card_numbers    = [int(val) for val in NUMBER_PATTERN.findall(card_numbers)]
     return card_id, Card(winning_numbers, card_numbers)
 
 def parse_data(data):
     '''
     Function parses the input data file contents.
-    Returns a dictionary with card_id as the key and the corresponding Card object as the value.
+    Returns a list of the Card objects, ordered by their card_id (the card with id 1 is the first entry, and so on).
     '''
-    cards = {}
+    cards = []
     for line in data:
         try:
-            card_id, card = parse_line(line)
-            cards[card_id] = card
+            cards.append(parse_line(line))
         except ValueError:
             continue
-    return cards
+    cards.sort(key=lambda entry: entry[0])    # The input is in order already, but this is here just to be safe
+    return [card for _, card in cards]
 
 
 def calculate_card_points(card):
@@ -133,40 +133,34 @@ def task1(cards):
     '''
     Solves and returns the solution for task 1.
     '''
-    total_points = 0
-    for _, card in cards.items():
-        total_points += calculate_card_points(card)
-    return total_points
+    return sum(calculate_card_points(card) for card in cards)
 
 def task2(cards):
     '''
     Solves and returns the solution for task 2.
     '''
-    # Dictionary telling how many copies of each card we have (original included)
-    nof_copies = {}
-    for card_id in cards:
-        nof_copies[card_id] = 1
+    # Each card copies the next 'n_matches' cards, so the copies won by the cards can be bookkept as a difference array:
+    # won_copies_delta[idx] tells how much the number of won copies changes from the card idx-1 to the card idx.
+    # The number of copies of a card is then a running (prefix) sum over this array, without looping over the copied cards.
+    n_cards             = len(cards)
+    won_copies_delta    = [0] * (n_cards+1)
+    won_copies          = 0
+    total_number_cards  = 0
 
     # Loop through each card
-    for card_id, card in cards.items():
-        n_copies = nof_copies[card_id]
-        n_matches = card.calculate_matches()
-
-        # For the next 'n_matches' cards, add copies corresponding to how many copies this card had
-        for other_card_id in range(card_id+1, card_id + n_matches+1):
-            try:
-                nof_copies[other_card_id] += n_copies
-
-            # It was guaranteed from the assignment that cards "outside the table" would never be copied,
-            # but this is here just to be safe
-            except KeyError:
-                continue
-
-    # Calculate and return the total number of cards
-    total_number_cards = 0
-    for card_id, num in nof_copies.items():
-        total_number_cards += num
-    
+    for idx, card in enumerate(cards):
+        won_copies += won_copies_delta[idx]
+        n_copies    = 1 + won_copies    # Original included
+        n_matches   = card.calculate_matches()
+        total_number_cards += n_copies
+
+        # The next 'n_matches' cards get copies corresponding to how many copies this card had.
+        # It was guaranteed from the assignment that cards "outside the table" would never be copied,
+        # but the range is clipped just to be safe
+        if n_matches > 0:
+            won_copies_delta[idx+1]                         += n_copies
+            won_copies_delta[min(idx+1+n_matches, n_cards)] -= n_copies
+
     return total_number_cards
 
 # =========================
@@ -65,10 +65,7 @@ def load_file(fn: str)  -> str:
     @returns:       contents of the file as a string
     '''
     with open(fn,'r') as file:
-        ret = ''
-        for line in file:   # Loop through the file and add the lines to the return value
-            ret += line
-    return ret.split('\n')
+        return file.read().splitlines()     # Read the file in one go and split it from the line breaks
 
 
 def parse_games_task1(data):
@@ -94,11 +91,16 @@ def solve_quadratic_equation(a,b,c):
     '''
     Solves an equation of form ax^2 + bx + c = 0.
     '''
-    if b**2 - 4*a*c < 0:
+    discriminant = b**2 - 4*a*c
+    if discriminant < 0:
         return None
-    roots = [(-b - math.sqrt(b**2 - 4*a*c))/(2*a), (-b + math.sqrt(b**2 - 4*a*c))/(2*a)]
-    roots.sort()
-    return roots
+    sqrt_discriminant = math.sqrt(discriminant)
+    root_1 = (-b - sqrt_discriminant)/(2*a)
+    root_2 = (-b + sqrt_discriminant)/(2*a)
+    # The roots are in ascending order if a > 0 and in descending order if a < 0
+    if a > 0:
+        return root_1, root_2
+    return root_2, root_1
 
 def ways_to_beat_record(t_total, record):
     '''
@@ -117,10 +119,7 @@ def task1(games):
     '''
     Solution for task 1.
     '''
-    prod = 1
-    for t_total, record in games:
-        prod = prod * ways_to_beat_record(t_total, record)
-    return prod
+    return math.prod(ways_to_beat_record(t_total, record) for t_total, record in games)
 
 def task2(game):
     '''
@@ -66,10 +66,7 @@ def load_file(fn: str)  -> str:
     @returns:       contents of the file as a string
     '''
     with open(fn,'r') as file:
-        ret = ''
-        for line in file:   # Loop through the file and add the lines to the return value
-            ret += line
-    return ret.split('\n')
+        return file.read().splitlines()     # Read the file in one go and split it from the line breaks
 
 # =========================
 
@@ -91,108 +88,82 @@ CARD_VALUES_1 = { 'A': 14, 'K': 13, 'Q': 12, 'J': 11, 'T': 10, '9': 9, '8': 8, '
 # Enumerations of card values in task 2
 CARD_VALUES_2 = { 'A': 14, 'K': 13, 'Q': 12, 'T': 10, '9': 9, '8': 8, '7': 7, '6': 6, '5': 5, '4': 4, '3': 3, '2': 2, 'J': 1 }
 
+# Translation tables from each card to its value as a single hexadecimal digit, e.g. 'K' -> 'd' in task 1
+CARD_HEX_DIGITS_1 = str.maketrans({card: f"{value:x}" for card, value in CARD_VALUES_1.items()})
+CARD_HEX_DIGITS_2 = str.maketrans({card: f"{value:x}" for card, value in CARD_VALUES_2.items()})
+
 class Hand:
     '''
     Represents an instance of five cards and a bounty
     '''
+    __slots__ = ('cards', 'bounty', 'hand_key', 'hand_key_2', 'rank')
+
     def __init__(self, cards, bounty) -> None:
         self.cards      = cards
         self.bounty     = int(bounty)
-        self.hand_value = None
+        self.hand_key   = None
+        self.hand_key_2 = None
         self.rank       = None
 
-    def determine_hand_value_task_1(self):
-        '''
-        Determines and sets thehand value according to the rules in task 1
-        '''
-        self.hand_value = determine_hand_value_task(self.cards, joker=False)
-
-        # Tiebreak logic: Collect the numerical values of each of the five cards in their original order as a string; for example,
-        # K29TQ would become '1302091012'. Then multiply by 1e-10 to get a decimal value less than zero, and addthis value to the base rank value.
-        # Now, when comparing two hands, the main rank precedes, andthis tiebreak is used if the main rank is the same.
-        tiebreak = f"{CARD_VALUES_1[self.cards[0]]:02d}{CARD_VALUES_1[self.cards[1]]:02d}{CARD_VALUES_1[self.cards[2]]:02d}{CARD_VALUES_1[self.cards[3]]:02d}{CARD_VALUES_1[self.cards[4]]:02d}"
-        self.hand_value += int(tiebreak) * 1e-10
-
-    def determine_hand_value_task_2(self):
+    def determine_hand_keys(self):
         '''
-        Determines and sets thehand value according to the rules in task 1
+        Determines and sets the hand keys according to the rules in both task 1 (hand_key) and task 2 (hand_key_2)
         '''
-        self.hand_value = determine_hand_value_task(self.cards, joker=True)
+        hand_value_1, hand_value_2 = determine_hand_values(self.cards)
 
-        # Same tiebreak logic as in task 1, but with the alternate values (J is the least valuable as a tiebreak)
-        tiebreak = f"{CARD_VALUES_2[self.cards[0]]:02d}{CARD_VALUES_2[self.cards[1]]:02d}{CARD_VALUES_2[self.cards[2]]:02d}{CARD_VALUES_2[self.cards[3]]:02d}{CARD_VALUES_2[self.cards[4]]:02d}"
-        self.hand_value += int(tiebreak) * 1e-10
+        # Tiebreak logic: translate the five cards in their original order to hexadecimal digits and parse them as a single integer;
+        # for example, K29TQ would become 0xd29ac. The hand value is then placed in the bits above these 20 bits, so when comparing
+        # two hands, the hand value precedes, and the card values are used as a tiebreak if the hand value is the same.
+        # Task 2 uses the alternate card values (J is the least valuable as a tiebreak).
+        self.hand_key   = (hand_value_1 << 20) | int(self.cards.translate(CARD_HEX_DIGITS_1), 16)
+        self.hand_key_2 = (hand_value_2 << 20) | int(self.cards.translate(CARD_HEX_DIGITS_2), 16)
 
     def __repr__(self) -> str:
         return ''.join(self.cards)
 
 
-def find_n_of_a_kind(hand: list, n: int, joker=False):
-    '''
-    Function searches the hand for a set of exactly n of a kind, and returns a list containing all ranks where this condition was met.
-    If joker=True, treats J cards as jokers. To avoid  the same joker to be counted multiple times in multiple sets, it is removed after the first
-    occurence of a set of n kind.
-    '''
-    ret = []
-    hand = list(hand)
-    for rank in ['A','K','Q','J','T','9','8','7','6','5','4','3','2']:
-        sets = [card for card in hand if card == rank or (joker and card == 'J')]
-        if len(sets) == n:
-            ret.append(rank)
-            if joker:
-                hand = [card for card in hand if card != "J" and card != rank]
-    return ret
-
-def has_full_house(hand: list, joker=False):
-    '''
-    Function checks if the hand has a full house, and returns True if it does, and False if it does not.
-    If joker=True, J is interpreted as joker.
-    '''
-    hand = list(hand)
-    pair = False
-    trips = False
-    for rank in ['A','K','Q','J','T','9','8','7','6','5','4','3','2']:
-        sets = [card for card in hand if card == rank or (joker and card == 'J')]
-        if len(sets) == 3:
-            trips = True
-            if joker:
-                hand = [card for card in hand if card != "J" and card != rank]
-        if len(sets) == 2:
-            pair = True
-            if joker:
-                hand = [card for card in hand if card != "J" and card != rank]  
-    return trips and pair
-
-
-def determine_hand_value_task(hand: list, joker=False):
-    '''
-    Determines and returns the value (rank) of a hand.
-    If joker=True, J is treated as joker.
-    '''
-    if len(find_n_of_a_kind(hand, 5, joker=joker)) > 0:
-        return HandValues.FIVES
-    if len(find_n_of_a_kind(hand, 4, joker=joker)) > 0:
-        return HandValues.FOURS
-    if has_full_house(hand,joker=joker):
-        return HandValues.FULLHOUSE
-    if len(find_n_of_a_kind(hand, 3, joker=joker)):
-        return HandValues.SET
-    if len(find_n_of_a_kind(hand, 2, joker=joker)) > 1:
-        return HandValues.TWOPAIRS
-    if len(find_n_of_a_kind(hand, 2, joker=joker)) > 0:
-        return HandValues.PAIR
-    return HandValues.HIGH
+# Hand values corresponding to the card counts of a hand, sorted from the largest count to the smallest.
+# For example, a hand 'KTJJT' has the counts (2,2,1) -> two pairs.
+HAND_SHAPES = { (5,):           HandValues.FIVES,
+                (4,1):          HandValues.FOURS,
+                (3,2):          HandValues.FULLHOUSE,
+                (3,1,1):        HandValues.SET,
+                (2,2,1):        HandValues.TWOPAIRS,
+                (2,1,1,1):      HandValues.PAIR,
+                (1,1,1,1,1):    HandValues.HIGH }
+
+
+def determine_hand_values(hand: str):
+    '''
+    Determines and returns the values (ranks) of a hand as a tuple (value_task_1, value_task_2).
+    In task 2, J is treated as joker.
+    '''
+    counts = collections.Counter(hand)
+    shape = sorted(counts.values(), reverse=True)
+    hand_value_1 = HAND_SHAPES[tuple(shape)]
+
+    # Jokers are always best used as more cards of the most common rank. Without jokers (or with only jokers), the value is the same in both tasks
+    jokers = counts.get('J', 0)
+    if jokers in (0, 5):
+        return hand_value_1, hand_value_1
+
+    # Reuse the same sorted counts: remove the count of the jokers and add it to the largest remaining count.
+    # The counts stay sorted, as the largest count only grows.
+    shape.remove(jokers)
+    shape[0] += jokers
+    return hand_value_1, HAND_SHAPES[tuple(shape)]
 
 
 def parse_data_to_hands(data):
     '''
-    Function parses the input data to a list of Hand objects.
+    Function parses the input data to a list of Hand objects, with the hand keys of both tasks determined.
     '''
     hands = []
     for line in data:
         try:
             cards, bounty = line.split(" ")
             hand = Hand(cards=cards, bounty=bounty)
+            hand.determine_hand_keys()
             hands.append(hand)
         except ValueError:
             pass
@@ -202,13 +173,9 @@ def task1(hands):
     '''
     Solution to the first task
     '''
-    # Determine the value of each hand
-    for hand in hands:
-        hand.determine_hand_value_task_1()
-    
     # Sort the hands in ascending order based on their value, and rank them from 1 to n.
     # Add money to the pot equal to each hands bounty multiplied by its rank.
-    hands.sort(key=lambda x: x.hand_value)
+    hands.sort(key=lambda x: x.hand_key)
     total_bounty = 0
     for rank, hand in enumerate(hands, start=1):
         total_bounty += rank * hand.bounty
@@ -220,13 +187,9 @@ def task2(hands):
     '''
     Solution to the second task
     '''
-    # Determine the value of each hand
-    for hand in hands:
-        hand.determine_hand_value_task_2()
-    
     # Sort the hands in ascending order based on their value, and rank them from 1 to n.
     # Add money to the pot equal to each hands bounty multiplied by its rank.
-    hands.sort(key=lambda x: x.hand_value)
+    hands.sort(key=lambda x: x.hand_key_2)
     total_bounty = 0
     for rank, hand in enumerate(hands, start=1):
         total_bounty += rank * hand.bounty
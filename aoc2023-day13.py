@@ -39,6 +39,7 @@ import argparse
 import collections
 import itertools
 import math
+from pathlib import Path
 
 
 # Type the path to your input text file here if you do not wish to use the command line argument
@@ -65,145 +66,83 @@ def load_file(fn: str)  -> str:
     @param fn:      path to the file to-be-loaded
     @returns:       contents of the file as a string
     '''
-    with open(fn,'r') as file:
-        ret = ''
-        for line in file:   # Loop through the file and add the lines to the return value
-            ret += line
-    return ret.split('\n\n')
+    return Path(fn).read_text().split('\n\n')     # Read the file in one go and split it into the patterns
 
 # =========================
 
-def transpose_map(map: list)  -> list:
+# Translation table from map characters to binary digits
+MAP_TO_BINARY = str.maketrans('#.', '10')
+
+
+def encode_map(map: list) -> tuple:
     '''
-    Transposes the given map: first row becomes first column, second row becomes the second column, and so on.
-    The map is assumed to have strings as its entries rather than lists, so it is actually a 1D-list.
+    Encodes each row and each column of the map as an integer, treating '#' as a set bit and '.' as an unset bit.
+    Returns a tuple (rows, columns) of two lists of integers.
     Example:
-        map = ['1234','5678']
-        returns ['15','26','37','48']
+        map = ['#.##', '..#.']
+        returns ([0b1011, 0b0010], [0b10, 0b00, 0b11, 0b10])
+    Comparing two rows (or columns) is then a single integer comparison, and the number of (positional) differences
+    between two rows is the number of set bits in their XOR. As the columns are encoded straight away, vertical mirrors
+    can be searched for as horizontal mirrors without transposing the map itself.
     '''
-    # Transform the rows from strings to lists of strings
-    map_transposed = [[char for char in row] for row in map]
-
-    # Tranpose the map
-    map_transposed = [list(col) for col in zip(*map_transposed)]
-
-    # Rows to strings
-    map_transposed = [''.join(row) for row in map_transposed]
-    return map_transposed
+    rows    = [int(row.translate(MAP_TO_BINARY), 2) for row in map]
+    columns = [int(''.join(column).translate(MAP_TO_BINARY), 2) for column in zip(*map)]
+    return rows, columns
 
 
-def find_horizontal_mirrors(map: list) -> int:
-    '''
-    Finds horizontal mirrors, i.e. mirrors across multiple columns.
-    Returns the number of rows before the first mirror (that is, index_of_row_before_the_mirror + 1),
-    function does not check if there would be other mirrors as well.
-    Returns 0 if no horizontal reflections could be found.
-    '''
-    def _horizontal_mirror_recursion(map: list, row_idx_1: int, row_idx_2:int) -> bool:
-        '''
-        Checks if two rows are exactly the same. If they are, recursively check the similarity of the row before the first
-        and the row after the second row.
-        Returns True if the map could be mirrored the whole way, False if not.
-        '''
-        # If one index is outside the map, the mirroring was successful
-        if row_idx_1 < 0 or row_idx_2 >= len(map):
-            return True
-        # If the two rows are the same, recursively check the rows before firstrow and after second row
-        if map[row_idx_1] == map[row_idx_2]:
-            return _horizontal_mirror_recursion(map, row_idx_1-1, row_idx_2+1)
-        # If there were differences, mirroring could not be done
-        return False
-    
-    # Check through each pair of adjacent rows if the map could be mirrored between those rows
-    for first_row_idx in range(len(map)):
-        is_mirrored = _horizontal_mirror_recursion(map, first_row_idx, first_row_idx+1)
-        if is_mirrored:
-            return first_row_idx + 1
-    
-    # If no mirrors could be found, return 0
-    return 0
-
-
-def find_horizontal_mirrors_with_smudge(map: list) -> int:
-    '''
-    Finds horizontal mirrors, i.e. mirrors across multiple columns, with exactly one smudge
-    (i.e. exactly one "error" in the reflection).
-    Returns the number of rows before the first mirror (that is, index_of_row_before_the_mirror + 1),
-    function does not check if there would be other mirrors as well.
-    Returns 0 if no horizontal reflections could be found.
-    '''
-    def _nof_differences(s1: str, s2: str) -> int:
-        '''
-        Returns the number of (positional) differences between two strings.
-        For example, s1='..#.#', s2='#...#', returns 2
-        '''
-        return len([1 for c1, c2 in zip(s1,s2) if c1 != c2])
-
-    def _horizontal_mirror_recursion(map: list, row_idx_1: int, row_idx_2: int, smudge_corrected: bool) -> bool:
-        '''
-        Checks if two rows are exactly the same. If they are, recursively check the similarity of the row before the first
-        and the row after the second row.
-        Exactly one error is _required_ across all the reflections, this is depicted in the boolean smudge_corrected.
-        If an error is found, flip the boolean to True and continue; terminate the search for the second error encountered.
-        Returns True if the map could be mirrored the whole way (with exactly one error), False if not.
-        '''
-        # Outside the map -> recursion is complete. As exactly one error is required, return the info is such an error was met or not
-        if row_idx_1 < 0 or row_idx_2 >= len(map):
-            return smudge_corrected
-        # Check the number of differences between the rows. If none, continue recursion and do not switch the smudge_corrected flag.
-        # If exactly one difference, if a difference was not met previously, continue recursion but set the flag smudge_corrected to True.
-        # If exactly one difference and a difference was met previously, or multiple differences, failure -> abort search and return False.
-        nof_differences = _nof_differences(map[row_idx_1], map[row_idx_2])
-        if nof_differences == 0:
-            return _horizontal_mirror_recursion(map, row_idx_1-1, row_idx_2+1, smudge_corrected)
-        elif nof_differences == 1 and not smudge_corrected:
-            return _horizontal_mirror_recursion(map, row_idx_1-1, row_idx_2+1, True)
-        return False
-    
-    # Check through each pair of adjacent rows if the map could be mirrored between those rows
-    for first_row_idx in range(len(map)):
-        is_mirrored = _horizontal_mirror_recursion(map, first_row_idx, first_row_idx+1, False)
-        if is_mirrored:
-            return first_row_idx + 1
-        
-    # If no mirrors could be found, return 0
-    return 0
-
-
-def part1(data: list) -> int:
+def find_horizontal_mirrors(rows: list) -> tuple:
     '''
-    Solution for the part 1.
+    Finds horizontal mirrors, i.e. mirrors across multiple columns, both without smudges and with exactly one smudge
+    (i.e. exactly one "error" in the reflection). The rows are given as integers, see encode_map.
+    Returns a tuple (mirror_without_smudges, mirror_with_one_smudge), where both values are the number of rows before the first
+    such mirror (that is, index_of_row_before_the_mirror + 1), or 0 if no such mirror could be found.
+    Function does not check if there would be other mirrors as well.
     '''
-    summarize = 0
-    for part in data:
-        map = part.split("\n")
-
-        # Horizontal mirrors
-        summarize += 100 * find_horizontal_mirrors(map)
-
-        # Vertical mirrors -> transpose the map and then look for horizontal mirrors
-        map_t = transpose_map(map)
-        summarize += find_horizontal_mirrors(map_t)
-
-    return summarize
-
-
-def part2(data: list) -> int:
+    n_rows = len(rows)
+    mirrors = [0, 0]    # The first found mirror for both smudge counts, indexed by the number of smudges
+
+    # Check through each pair of adjacent rows if the map could be mirrored between those rows: compare the rows pairwise
+    # outwards from the split until one index is outside the map. Both smudge counts share the same comparisons, and the
+    # comparison of a split is terminated as soon as there are more differences than either of them allows.
+    for first_row_idx in range(n_rows-1):
+        row_idx_1, row_idx_2 = first_row_idx, first_row_idx+1
+        nof_differences = 0
+        while row_idx_1 >= 0 and row_idx_2 < n_rows:
+            if rows[row_idx_1] != rows[row_idx_2]:
+                nof_differences += (rows[row_idx_1] ^ rows[row_idx_2]).bit_count()
+                if nof_differences > 1:
+                    break
+            row_idx_1 -= 1
+            row_idx_2 += 1
+        else:
+            # The map could be mirrored the whole way with nof_differences smudges; keep only the first mirror of each count
+            if not mirrors[nof_differences]:
+                mirrors[nof_differences] = first_row_idx + 1
+                if all(mirrors):
+                    break
+
+    return tuple(mirrors)
+
+
+def solve(data: list) -> tuple:
     '''
-    Solution for the part 2.
+    Solution for both parts: each pattern is encoded and scanned only once, and the mirrors of both parts are searched for
+    at the same time. Returns a tuple (part1_solution, part2_solution).
     '''
-    summarize = 0
+    summarize = [0, 0]
     for part in data:
-        map = part.split("\n")
+        map = [row for row in part.split("\n") if row]
+        rows, columns = encode_map(map)
 
         # Horizontal mirrors
-        summarize += 100 * find_horizontal_mirrors_with_smudge(map)
+        for n_smudges, mirror in enumerate(find_horizontal_mirrors(rows)):
+            summarize[n_smudges] += 100 * mirror
 
-        # Vertical mirrors -> transpose the map and then look for horizontal mirrors
-        map_t = transpose_map(map)
-        summarize += find_horizontal_mirrors_with_smudge(map_t)
+        # Vertical mirrors -> look for horizontal mirrors between the columns
+        for n_smudges, mirror in enumerate(find_horizontal_mirrors(columns)):
+            summarize[n_smudges] += mirror
 
-    return summarize
+    return tuple(summarize)
 
 
 # =========================
@@ -211,6 +150,7 @@ def part2(data: list) -> int:
 if  __name__ == "__main__":
     fn = get_fn()
     data = load_file(fn)
+    part1_solution, part2_solution = solve(data)
 
-    print(f"Part 1 solution: {part1(data)}")
-    print(f"Part 2 solution: {part2(data)}")
\ No newline at end of file
+    print(f"Part 1 solution: {part1_solution}")
+    print(f"Part 2 solution: {part2_solution}")
@@ -39,6 +39,7 @@ import argparse
 import collections
 import itertools
 import math
+from pathlib import Path
 
 
 # Type the path to your input text file here if you do not wish to use the command line argument
@@ -65,74 +66,130 @@ def load_file(fn: str)  -> str:
     @param fn:      path to the file to-be-loaded
     @returns:       contents of the file as a string
     '''
-    with open(fn,'r') as file:
-        ret = ''
-        for line in file:   # Loop through the file and add the lines to the return value
-            ret += line
-    return ret.split('\n')
+    return Path(fn).read_text().splitlines()       # Read the file in one go and split it from the line breaks (no trailing empty row)
 
 # =========================
 
-def rotate_map_clockwise(map):
-    '''
-    Function takes a 2D-list as an input and creates a copy, which is rotated 90 degrees clockwise.
-    For example:
-        rotate_map_clockwise(  [[1,2,3],
-                                [4,5,6],
-                                [7,8,9]])
+# The platform is represented as bitboards: Python integers where each bit corresponds to one tile of the platform.
+# The tile on row 'row' and column 'col' is the bit number row*width + col, so the tiles are numbered row by row from
+# the northwest corner. For example, the platform
+#       O.#
+#       .O.
+# has the round stones in the bits 0 and 4 -> 0b10001.
+# Moving a stone one tile to north (or south) is then a shift of 'width' bits down (or up), and to west (or east) a shift
+# of one bit down (or up). This way, all stones of the platform can be moved at once with a handful of integer operations.
 
-        returns                [[7,4,1],
-                                [8,5,2],
-                                [9,6,3]]
-    '''
-    return [list(column[::-1]) for column in zip(*map)]
+# Directions to tilt the platform to, as (row, col) steps
+NORTH   = (-1,  0)
+WEST    = ( 0, -1)
+SOUTH   = ( 1,  0)
+EAST    = ( 0,  1)
+
+# Translation tables from the platform characters to binary digits of the round stone and the open tile bitboards
+ROUND_TO_BINARY = str.maketrans('O.#', '100')
+OPEN_TO_BINARY  = str.maketrans('O.#', '110')
 
 
-def tilt_to_north(map: list):
+def parse_platform(map: list) -> tuple:
     '''
-    Tilts the map to north: moves all round stones (O) as far nort as they can. They can go over empty
-    spaces (.), but not over rectangular stones (#) or each other.
-    Returns the tilted map, though the operations are done on the original input map.
+    Parses the platform into bitboards.
+    Returns a tuple (round_stones, open_tiles, width, height), where round_stones is the bitboard of the round stones (O),
+    and open_tiles the bitboard of the tiles where the round stones can be at, i.e. all tiles except the rectangular stones (#).
     '''
-    # Dictionary to keep tracks which spots (rows) on each column are empty
-    # -> to which spaces the stones can roll to
-    available_spots = {}
-    for col_idx in range(len(map[0])):
-        available_spots[col_idx] = []
-
-    # Loop through each row, and on each row loop through each column
-    for row_idx in range(len(map)):
-        for col_idx in range(len(map[row_idx])):
-
-            # Current space has a round boulder: check if there are empty spaces to north where this boulder can roll to
-            if map[row_idx][col_idx] == 'O':
-                empty_rows = available_spots[col_idx]
-
-                # If there are: move the boulder to the first (northernmost) empty space, set this space as empty, and remove the previously empty space from the list
-                if len(empty_rows) > 0:
-                    map[empty_rows[0]][col_idx] = 'O'
-                    map[row_idx][col_idx] = '.'
-                    available_spots[col_idx].pop(0)
-
-            # Current space is empty: add the space to the list of empty spaces
-            # (this can be a space where a boulder was moved away just in previous if clause!)
-            if map[row_idx][col_idx] == '.':
-                available_spots[col_idx].append(row_idx)
+    height  = len(map)
+    width   = len(map[0])
+    round_stones    = 0
+    open_tiles      = 0
+    for row_idx, row in enumerate(map):
+        # Each row is translated into two strings of binary digits and parsed as a whole. The row is reversed,
+        # as the column 0 is the least significant bit of the row.
+        row = row[::-1]
+        shift = row_idx*width
+        round_stones    |= int(row.translate(ROUND_TO_BINARY), 2) << shift
+        open_tiles      |= int(row.translate(OPEN_TO_BINARY), 2) << shift
+    return round_stones, open_tiles, width, height
+
+
+def tilt_parameters(width: int, height: int, direction: tuple) -> tuple:
+    '''
+    Computes the parameters needed to tilt a platform of the given size to the given direction.
+    Returns a tuple (shift, not_edge, downwards), where shift is the number of bits a stone moves by on one step, not_edge is the
+    mask of the tiles from which a stone can move to the given direction, and downwards tells whether the stones move towards
+    the lower bits (north and west) or not.
+    '''
+    # Mask of the tiles on the edge of the platform to the given direction; stones on these tiles cannot move any further.
+    # (Rows need no masking, as the stones would be shifted outside of the open tiles or below the bit 0.)
+    if direction == WEST:
+        edge = sum(1 << (row_idx*width) for row_idx in range(height))
+    elif direction == EAST:
+        edge = sum(1 << (row_idx*width + width-1) for row_idx in range(height))
+    else:
+        edge = 0
+    shift = abs(direction[0]*width + direction[1])
+    return shift, ~edge, direction in (NORTH, WEST)
+
+
+def tilt(round_stones: int, open_tiles: int, shift: int, not_edge: int, downwards: bool) -> int:
+    '''
+    Tilts the platform to the direction given by the parameters (see tilt_parameters): moves all round stones (O) as far to that
+    direction as they can. They can go over empty spaces (.), but not over rectangular stones (#) or each other.
+    Returns the bitboard of the round stones after the tilt.
+    '''
+    # Move all stones that have an empty tile next to them by one tile at a time, until no stone can move anymore
+    while True:
+        empty = open_tiles & ~round_stones
+        if downwards:
+            movable = round_stones & (empty << shift) & not_edge
+            moved   = movable >> shift
+        else:
+            movable = round_stones & (empty >> shift) & not_edge
+            moved   = movable << shift
+        if movable == 0:
+            return round_stones
+        round_stones = (round_stones ^ movable) | moved
+
+
+def spin_cycle(round_stones: int, open_tiles: int, cycle_parameters: list) -> int:
+    '''
+    Runs one spin cycle: tilts the platform north, west, south and east, in this order.
+    The tilt parameters of the four directions are given in the same order, see tilt_parameters.
+    Returns the bitboard of the round stones after the cycle.
+    '''
+    for shift, not_edge, downwards in cycle_parameters:
+        round_stones = tilt(round_stones, open_tiles, shift, not_edge, downwards)
+    return round_stones
 
-            # Current space has a rectangular space: empty the list of empty spaces, as no boulders can roll past this boulder
-            if map[row_idx][col_idx] == '#':
-                available_spots[col_idx] = []
 
-    return map
+def calculate_load(round_stones: int, width: int, height: int) -> int:
+    '''
+    Function calculates and returns the load to the north support beams as per the assignment.
+    '''
+    ans = 0
+    row_mask = (1 << width) - 1
+    for row_idx in range(height):
+        coeff = height - row_idx   # The southernmost row has the coefficient 1, the row above it 2 and so on
+        ans += coeff * ((round_stones >> (row_idx*width)) & row_mask).bit_count()
+    return ans
 
 
-def calculate_load(map):
+def calculate_load_tilted_north(map: list) -> int:
     '''
-    Function calculates and returns the load to the north support beams as per the assignment.
+    Function calculates and returns the load to the north support beams after tilting the platform to north, without actually
+    moving the stones: the row where each round stone would stop is tracked with a single cursor per column.
     '''
+    height      = len(map)
+    target_rows = [0] * len(map[0])     # For each column, the northernmost row where the next round stone would roll to
     ans = 0
-    for coeff, row in enumerate(map[::-1], start=1): # Enumerate from bottom to up, starting from index 1
-        ans += coeff * len([stone for stone in row if stone == 'O'])
+    for row_idx, row in enumerate(map):
+        for col_idx, obj in enumerate(row):
+            # Rectangular stone: the next round stones of this column can roll only until the row below it
+            if obj == '#':
+                target_rows[col_idx] = row_idx + 1
+
+            # Round stone: the stone rolls to the target row, and the next one of this column would stop on the row below it
+            elif obj == 'O':
+                ans += height - target_rows[col_idx]
+                target_rows[col_idx] += 1
     return ans
 
 
@@ -142,62 +199,41 @@ def part1(map: list) -> int:
     '''
     Solution for the part 1.
     '''
-    map = [[obj for obj in row] for row in map if row.strip()] # Transform the rows from strings to lists of strings, e.g. '.#.O.' -> ['.', '#', '.', 'O', '.']
-    map = tilt_to_north(map)
-    return calculate_load(map)
+    return calculate_load_tilted_north(map)
 
 
 def part2(map: list) -> int:
     '''
     Solution for the part 2.
     '''
-    map = [[obj for obj in row] for row in map if row.strip()] # Transform the rows from strings to lists of strings, e.g. '.#.O.' -> ['.', '#', '.', 'O', '.']
-    states_encountered  = {}    # Dictionary to keep track on which map states has already been encountered, and on which cycle numbers
-    weights             = {}    # Dictionary to record information on all cycles' load weights
-    target_cycle        = 1_000_000_000   # From the assignment
+    round_stones, open_tiles, width, height = parse_platform(map)
+    cycle_parameters    = [tilt_parameters(width, height, direction) for direction in (NORTH, WEST, SOUTH, EAST)]    # Computed once for all cycles
+    states_encountered  = {}    # Dictionary to keep track on which platform states has already been encountered, and on which cycle numbers
+    states              = [round_stones]    # All platform states, indexed by the cycle number (index 0: the initial state)
+    target_cycle        = 1_000_000_000     # From the assignment
 
     for cycle in range(1,target_cycle+1):
-        # Idea: Tilting north->west->south->east is equivalent to tilting north, then rotating the whole map 90 degrees clockwise, then
-        # tilting north again, then rotating again, and so on, altogether four times each. This avoids the need of writing multiple functions for
-        # tilting the map
-
-        # North
-        map = tilt_to_north(map)
-
-        # West
-        map = rotate_map_clockwise(map)
-        map = tilt_to_north(map)
-
-        # South
-        map = rotate_map_clockwise(map)
-        map = tilt_to_north(map)
-
-        # East
-        map = rotate_map_clockwise(map)
-        map = tilt_to_north(map)
+        # Tilt the platform north->west->south->east. As the round stones are the only thing that moves, the bitboard of the
+        # round stones describes the whole state of the platform, and it can be used as the dictionary key as it is
+        round_stones = spin_cycle(round_stones, open_tiles, cycle_parameters)
 
-        # Rotate back to north
-        map = rotate_map_clockwise(map)
-        
-        # Check if the resulting map state has been encountered
-        map_as_str = ''.join([''.join(row) for row in map])
-        if map_as_str in states_encountered:
+        # Check if the resulting platform state has been encountered
+        if round_stones in states_encountered:
 
             # As we have been in this state before, there is no need to continue rotating, as from now on the behaviour will be periodic
-            # Extract the load of the target cycle count from the past load values
-            previous_cycle  = states_encountered[map_as_str]                    # Previous cycle number where this exact state was encountered
+            # Extract the state of the target cycle count from the past states, and calculate the load of only that state
+            previous_cycle  = states_encountered[round_stones]                  # Previous cycle number where this exact state was encountered
             period_length   = cycle - previous_cycle                            # Period length: this count number - count number when last this state appeared
-            rem             = (target_cycle-previous_cycle) % period_length     # After haw many cycles of this one will be the same load value as the target count
+            rem             = (target_cycle-previous_cycle) % period_length     # After haw many cycles of this one will be the same state as the target count
 
-            return weights[previous_cycle+rem]
+            return calculate_load(states[previous_cycle+rem], width, height)
 
-        # If for some reason we hit the target count, just return the load value of this cycle
-        if cycle == target_cycle:
-            return calculate_load(map)
+        # Save this platform state
+        states_encountered[round_stones] = cycle
+        states.append(round_stones)
 
-        # Save this map state and load value
-        states_encountered[map_as_str]  = cycle
-        weights[cycle]                  = calculate_load(map)
+    # If for some reason we hit the target count, just return the load value of the last cycle
+    return calculate_load(round_stones, width, height)
 
 
 # =========================
@@ -40,11 +40,16 @@ import collections
 import itertools
 import math
 import re
+from pathlib import Path
 
 
 # Type the path to your input text file here if you do not wish to use the command line argument
 FILENAME = "./inputs/day15.txt"
 
+# Splits a step of the initialization sequence into the lens label, the operation (- or =) and the focal length (only with =),
+# e.g. "rn=1" -> ('rn', '=', '1') and "cm-" -> ('cm', '-', '')
+STEP_PATTERN = re.compile(r'([a-z]+)([-=])(\d*)')
+
 
 def get_fn() ->  str:
     '''
@@ -66,11 +71,7 @@ def load_file(fn: str)  -> str:
     @param fn:      path to the file to-be-loaded
     @returns:       contents of the file as a string
     '''
-    with open(fn,'r') as file:
-        ret = ''
-        for line in file:   # Loop through the file and add the lines to the return value
-            ret += line
-    return ret
+    return Path(fn).read_text()                    # Read the file in one go
 
 # =========================
 
@@ -79,12 +80,40 @@ def holiday_ascii_string_helper(inp):
     '''
     Hashes the input as per the assignment
     '''
+    # Iterating over bytes yields the ASCII codes directly as integers (no ord() call needed),
+    # and as 256 is a power of two, the modulo can be taken with a bit mask
     ret = 0
-    for char in inp:
-        ret = (ret + ord(char))*17 % 256
+    for code in inp.encode():
+        ret = (ret + code)*17 & 0xFF
     return ret
 
 
+def holiday_ascii_string_helper_sum(inputs):
+    '''
+    Hashes all the inputs as per the assignment and returns the sum of the hash values.
+    All inputs are hashed simultaneously in a SIMD-within-a-register fashion: the hash value of each input is held in its own
+    16-bit 'lane' of a single (large) Python integer, and each step of the hash algorithm is applied to all lanes at once
+    with a few integer operations. The lanes are wide enough that (hash + code)*17 <= (255+255)*17 < 2**16 never carries over
+    to the next lane.
+    '''
+    inputs  = [inp.encode() for inp in inputs]
+    n       = len(inputs)
+    length  = max((len(inp) for inp in inputs), default=0)
+
+    # Pad the inputs from the left with zero bytes: the hash of zero followed by a zero byte is zero, so this does not change the hashes.
+    # The i:th characters of all inputs are then every length:th byte of the concatenated inputs, starting from the byte i
+    padded  = b''.join(inp.rjust(length, b'\0') for inp in inputs)
+    mask    = int.from_bytes(b'\xff\0' * n, 'little')    # 0x...00FF00FF: lower byte of each lane
+    lanes   = bytearray(2*n)
+    hashes  = 0
+    for idx in range(length):
+        lanes[0::2] = padded[idx::length]   # The idx:th character of each input to the lower byte of its lane
+        hashes = (hashes + int.from_bytes(lanes, 'little'))*17 & mask
+
+    # Lower bytes of the lanes are the hash values
+    return sum(hashes.to_bytes(2*n, 'little')[0::2])
+
+
 
 # =========================
 
@@ -92,52 +121,46 @@ def part1(data: list) -> int:
     '''
     Solution for the part 1.
     '''
-    ans = 0
-    for section in data.split(','):
-        section = section.strip()
-        if not section:
-            continue
-        ans += holiday_ascii_string_helper(section)
-
-    return ans
+    sections = [section.strip() for section in data.split(',')]
+    return holiday_ascii_string_helper_sum([section for section in sections if section])
 
 
 def part2(data: list) -> int:
     '''
     Solution for the part 2.
     '''
-    # List of all the 256 boxes, in the correct order. Each of these 256 entries is a list containing the labels of the
-    # lenses inside, in the correct order (first lens on first position and so on)
-    boxes   = [[] for i in range(256)]
+    # List of all the 256 boxes, in the correct order. Each of these 256 entries is a dictionary mapping the labels of the
+    # lenses inside to their focal lengths. Dictionaries preserve the insertion order, so the lenses are in the correct order
+    # (first lens on first position and so on), and a lens can be added, updated or removed in constant time
+    boxes   = [{} for i in range(256)]
 
-    # Dictionary keeping track of each lense's focal length. Note that as the box is determined by the lens label's hash value,
-    # a lens with a certain name cannot exist in multiple boxes -> there are no risk of having a similarly labeled lens in multiple boxes
-    lenses  = {}
+    # Labels appear many times in the sequence -> cache the box (hash value) of each label
+    box_ids = {}
 
     for section in data.split(','):
+        # Skip empty sections (e.g. a trailing comma) and anything else that is not a valid step
+        match = STEP_PATTERN.match(section.strip())
+        if match is None:
+            continue
+        lens_label, operation, focal_length = match.groups()
+        box_id = box_ids.get(lens_label)
+        if box_id is None:
+            box_id = box_ids[lens_label] = holiday_ascii_string_helper(lens_label)
 
         # If command is -: remove the lens from the corresponding box, if it exists there
-        if '-' in section:
-            lens_label  = section.split('-')[0]
-            box_id      = holiday_ascii_string_helper(lens_label)
-            if lens_label in boxes[box_id]:
-                boxes[box_id].remove(lens_label)
-
-        # If command is =: add the lens to the corresponding box, _if it already isn't there_ (if it does, no modifications to the position),
-        # and update the lense's focal length
-        if  '=' in section:
-            lens_label      = section.split('=')[0]
-            focal_length    = int(section.split('=')[1])
-            box_id          = holiday_ascii_string_helper(lens_label)
-            lenses[lens_label] = focal_length
-            if lens_label not in boxes[box_id]:
-                boxes[box_id].append(lens_label)
+        if operation == '-':
+            boxes[box_id].pop(lens_label, None)
+
+        # If command is =: add the lens to the corresponding box, _if it already isn't there_, and update the lense's focal length.
+        # Updating the value of an existing key does not modify its position in the dictionary
+        else:
+            boxes[box_id][lens_label] = int(focal_length)
 
     # Go through each lens in each box and calculate the total focusing  power as per the assignment
     total_focusing_power = 0
     for box_id, box in enumerate(boxes, start=1):
-        for lens_slot, lens_id in enumerate(box, start=1):
-            total_focusing_power += box_id * lens_slot * lenses[lens_id]
+        for lens_slot, focal_length in enumerate(box.values(), start=1):
+            total_focusing_power += box_id * lens_slot * focal_length
 
     return total_focusing_power
 
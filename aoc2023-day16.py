@@ -36,7 +36,7 @@ Akseli Konttas, December 2023
 
 '''
 import argparse
-import queue
+from pathlib import Path
 
 
 # Type the path to your input text file here if you do not wish to use the command line argument
@@ -63,125 +63,258 @@ def load_file(fn: str)  -> str:
     @param fn:      path to the file to-be-loaded
     @returns:       contents of the file as a string
     '''
-    with open(fn,'r') as file:
-        ret = ''
-        for line in file:   # Loop through the file and add the lines to the return value
-            ret += line
-    return [[obj for obj in row] for row in ret.split('\n')]
+    return [[obj for obj in row] for row in Path(fn).read_text().splitlines()]     # Read the file in one go and split it from the line breaks (no trailing empty row)
 
 # =========================
 
-# Coordinates for the different compass coordinates
-DIRECTIONS =   { "N": {'row': -1, 'col':  0},
-                 "S": {'row':  1, 'col':  0},
-                 "W": {'row':  0, 'col': -1},
-                 "E": {'row':  0, 'col':  1},                       
-                }
+# Enumerations of the compass directions
+NORTH   = 0
+SOUTH   = 1
+WEST    = 2
+EAST    = 3
 
+# Coordinate steps (row, col) to the different compass directions, indexed by the direction
+DIRECTIONS = (  (-1,  0),   # North
+                ( 1,  0),   # South
+                ( 0, -1),   # West
+                ( 0,  1),   # East
+              )
 
-def reflect_light(direction, mirror):
+
+# Directions where the light continues after a mirror, indexed by the direction of the light hitting the mirror
+REFLECT = { '/':    (EAST, WEST, SOUTH, NORTH),
+            '\\':   (WEST, EAST, NORTH, SOUTH),
+          }
+
+# Directions where the light continues after a splitter, indexed by the direction of the light hitting the splitter.
+# Depending on the initial direction and the splitter type, the light either splits into two beams or continues in straight line.
+SPLIT = {   '|':    ((NORTH,), (SOUTH,), (NORTH, SOUTH), (NORTH, SOUTH)),
+            '-':    ((WEST, EAST), (WEST, EAST), (WEST,), (EAST,)),
+        }
+
+# Lookup table combining all tiles: tile -> tuple of the directions where the light continues after the tile, indexed by the
+# direction of the light entering the tile. This way, no per-tile function calls or allocations are needed during the traversal.
+NEXT_DIRECTIONS = { '.': tuple((direction,) for direction in range(len(DIRECTIONS))) }
+NEXT_DIRECTIONS.update({mirror: tuple((direction,) for direction in reflected) for mirror, reflected in REFLECT.items()})
+NEXT_DIRECTIONS.update(SPLIT)
+
+
+# Tile outside the maze
+OUTSIDE = ' '
+
+
+def flatten_maze(maze):
     '''
-    Reflects the light going to direction 'direction' hitting a mirror shaped 'mirror'.
-    Returns the direction where the light continues after reflecting from this mirror.
+    Flattens the maze into a single string, surrounded by a border of OUTSIDE tiles.
+    Returns the string and the 'stride', i.e. the length of a row including the border: the tile (row, col) of the maze is
+    at the index (row+1)*stride + (col+1) of the string. This way, the position of a beam can be kept as a single integer, moving to
+    a direction is a single addition (see direction_steps), and going out of the maze is simply hitting an OUTSIDE tile.
     '''
-    if mirror == '/':
-        ref = {'N':'E' ,'E':'N', 'S':'W', 'W':'S'}
-        return ref[direction]
-    if mirror == '\\':
-        ref = {'N':'W' ,'W':'N', 'S':'E', 'E':'S'}
-        return ref[direction]
-    
+    stride  = len(maze[0]) + 2
+    border  = OUTSIDE * stride
+    return border + ''.join(OUTSIDE + ''.join(row) + OUTSIDE for row in maze) + border, stride
 
-def split_light(direction, splitter):
+
+def direction_steps(stride):
     '''
-    Splits the light going to direction 'direction' hitting a splitter shaped 'splitter'.
-    Returns the directions where the light continues after being splitted from this splitter, as a list.
-    Note that depending on the initial direction and the splitter type, the returned list can contain either one or two directions.
+    Returns the changes in the index of a flattened maze when moving to each direction, indexed by the direction.
     '''
-    split_directions = []
-    if splitter == '|' and direction in ('W','E'):
-        split_directions.append('N')
-        split_directions.append('S')
-    elif splitter == '-' and direction in ('N','S'):
-        split_directions.append('W')
-        split_directions.append('E')
-    else:
-        split_directions.append(direction)
-    return split_directions
+    return tuple(d_row*stride + d_col for d_row, d_col in DIRECTIONS)
 
 
 def n_energized_tiles(maze, row, col, direction):
     '''
     Calculates and returns the number of energized tiles, when the light enters the 'maze' from coordinates ['row', 'column'] going to direction 'direction'.
     '''
-    status  = [[list() for col in row] for row in data]     # 2D-list same size as maze containing information of to which directions a light beam has already passed through any tile
-    q       = queue.Queue()                                 # Queue holding info of paths not yet traversed
-    stop    = False                                         # Flag telling if all paths have been traversed
+    tiles, stride = flatten_maze(maze)
+    steps   = direction_steps(stride)
+    pos     = (row+1)*stride + (col+1)  # Position of the beam in the flattened maze
+    status  = bytearray(len(tiles))     # Information of to which directions a light beam has already passed through any tile, as a bitmask (bit n set -> passed to direction n)
+    stack   = []                        # Stack holding info of paths not yet traversed
+    stop    = False                     # Flag telling if all paths have been traversed
 
     while not stop:
-        status[row][col].append(direction)
-        current_tile = maze[row][col]
-
-        # Current tile is mirror: next tile is rotated to some direction
-        if current_tile in ('/', '\\'):
-            direction = reflect_light(direction, current_tile)
-
-        # Current tile is splitter: either continues in straight line or splits into two beams.
-        # The logic to determine this is in split_light
-        elif current_tile in ('-','|'):
-            next_directions = split_light(direction, current_tile)
-            direction = next_directions[0]
-            if len(next_directions) > 1:    # If there are multiple, splits light -> put the additional into queue to process it later
-                q.put([row, col, next_directions[1]])
-        else:
-            direction = direction
+        status[pos] |= 1 << direction
+
+        # Mirrors rotate the light to some direction, and splitters either let it continue in straight line or split it into
+        # two beams. If there are multiple directions, put the additional into stack to process it later
+        next_directions = NEXT_DIRECTIONS[tiles[pos]][direction]
+        direction = next_directions[0]
+        if len(next_directions) > 1:
+            stack.append((pos, next_directions[1]))
 
         # Next tile, according to the determined direction
-        row = row + DIRECTIONS[direction]['row']
-        col = col + DIRECTIONS[direction]['col']
+        pos += steps[direction]
 
-        # If the tile is outside the maze or it has already been processed, terminate and take next from queue
-        while not 0 <= row < len(maze) or not 0 <= col < len(maze[0]) or direction in status[row][col]:
-            if q.empty():
+        # If the tile is outside the maze or it has already been processed, terminate and take next from stack
+        while tiles[pos] == OUTSIDE or status[pos] & (1 << direction):
+            if not stack:
                 stop = True
                 break
-            row, col, direction = q.get()
-            row = row + DIRECTIONS[direction]['row']
-            col = col + DIRECTIONS[direction]['col']
+            pos, direction = stack.pop()
+            pos += steps[direction]
 
-    # 2D to 1D
-    status_flattened    = [obj for row in status for obj in row]
-    n_energized         = len([lst for lst in status_flattened if len(lst) > 0])
+    # Energized tiles: the tiles where at least one bit is set
+    n_energized = len(status) - status.count(0)
     return n_energized
 
 
+class BeamGraph:
+    '''
+    Class to calculate the number of energized tiles for many entry points of the same maze, sharing the work between them.
+
+    The paths of the light beams are split into 'segments': a segment starts from a tile where the beam leaves to some direction,
+    and follows the beam (through mirrors and splitters that do not split the beam) until the beam either exits the maze, or hits
+    a splitter which splits the beam into two. In the latter case the two beams leaving that splitter are the two 'successors' of
+    the segment. The segments and their successors form a directed graph, where the tiles energized by a beam are the tiles of
+    all segments reachable from the first segment.
+    As the beams can loop, the graph can have cycles. The segments are therefore grouped into strongly connected components
+    (within which all segments are reachable from each other, and thus energize the same tiles) with Tarjan's algorithm, and the
+    energized tiles are calculated only once per component, using the already calculated tiles of the components after it.
+    The positions in the maze are indices of the flattened maze (see flatten_maze), and the energized tiles are stored as bitmasks:
+    Python integers where the bit number 'pos' tells if the tile at position 'pos' is energized.
+    '''
+    def __init__(self, maze) -> None:
+        self.maze       = maze
+        self.tiles, self.stride = flatten_maze(maze)
+        self.steps      = direction_steps(self.stride)
+        self.segments   = {}    # (pos, direction) of the segment start -> (bitmask of the tiles of the segment, list of successor segments)
+        self.index      = {}    # Tarjan's algorithm: the order in which each segment was first visited
+        self.lowlink    = {}    # Tarjan's algorithm: the smallest index reachable from the segment in the search
+        self.component  = {}    # Segment -> id of the strongly connected component it belongs to
+        self.energized  = []    # Component id -> bitmask of the tiles energized by any segment in the component
+
+    def trace_segment(self, segment):
+        '''
+        Follows the beam leaving the position 'pos' to the given direction, as given in 'segment' = (pos, direction).
+        Returns the bitmask of the tiles the segment goes through, and the list of segments that start where this segment ends.
+        '''
+        if segment in self.segments:
+            return self.segments[segment]
+        pos, direction = segment
+        tiles   = 1 << pos
+        visited = {segment}     # The beam can loop without splitting; in that case the segment ends when it starts to repeat itself
+        while True:
+            pos += self.steps[direction]
+            if self.tiles[pos] == OUTSIDE:
+                successors = []
+                break
+            tiles |= 1 << pos
+            directions = NEXT_DIRECTIONS[self.tiles[pos]][direction]
+            if len(directions) > 1:
+                successors = [(pos, next_direction) for next_direction in directions]
+                break
+            direction = directions[0]
+            if (pos, direction) in visited:
+                successors = []
+                break
+            visited.add((pos, direction))
+        self.segments[segment] = (tiles, successors)
+        return tiles, successors
+
+    def energized_tiles(self, start):
+        '''
+        Returns the bitmask of all tiles energized by the beam starting with the segment 'start'.
+        Runs an (iterative) Tarjan's algorithm from the segment, finding and calculating the energized tiles of all
+        strongly connected components reachable from it that were not yet found in the previous calls.
+        '''
+        if start not in self.component:
+            stack   = []        # Segments of the components not yet completed
+            on_stack = set()
+            self.index[start] = self.lowlink[start] = len(self.index)
+            stack.append(start)
+            on_stack.add(start)
+            work = [(start, iter(self.trace_segment(start)[1]))]    # Depth-first search: (segment, iterator over its successors not yet processed)
+
+            while work:
+                segment, successors = work[-1]
+                for successor in successors:
+                    # Not yet visited: continue the depth-first search from the successor
+                    if successor not in self.index:
+                        self.index[successor] = self.lowlink[successor] = len(self.index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(self.trace_segment(successor)[1])))
+                        break
+                    # Visited and part of the current search path -> belongs to the same component
+                    if successor in on_stack:
+                        self.lowlink[segment] = min(self.lowlink[segment], self.index[successor])
+
+                # All successors processed
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        self.lowlink[parent] = min(self.lowlink[parent], self.lowlink[segment])
+
+                    # The segment is the root of a component: pop the component from the stack. The components reachable from it
+                    # have already been completed, so its energized tiles are its own tiles and the energized tiles of those components
+                    if self.lowlink[segment] == self.index[segment]:
+                        component_id = len(self.energized)
+                        members = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.remove(member)
+                            self.component[member] = component_id
+                            members.append(member)
+                            if member == segment:
+                                break
+                        tiles = 0
+                        for member in members:
+                            member_tiles, member_successors = self.segments[member]
+                            tiles |= member_tiles
+                            for successor in member_successors:
+                                if self.component[successor] != component_id:
+                                    tiles |= self.energized[self.component[successor]]
+                        self.energized.append(tiles)
+
+        return self.energized[self.component[start]]
+
+    def n_energized_tiles(self, row, col, direction):
+        '''
+        Calculates and returns the number of energized tiles, when the light enters the maze from coordinates ['row', 'column'] going to direction 'direction'.
+        '''
+        # The beam entering the tile leaves it to one or two directions -> one or two segments starting from this tile
+        pos   = (row+1)*self.stride + (col+1)
+        tiles = 1 << pos
+        for next_direction in NEXT_DIRECTIONS[self.tiles[pos]][direction]:
+            tiles |= self.energized_tiles((pos, next_direction))
+        return tiles.bit_count()
+
+
 # =========================
 
 def part1(maze: list) -> int:
     '''
     Solution for the part 1.
     '''
-    n_energized = n_energized_tiles(maze, 0, 0, 'E')
+    n_energized = n_energized_tiles(maze, 0, 0, EAST)
     return n_energized
 
 
-def part2(maze: list) -> int:
+def entry_points(maze: list) -> list:
     '''
-    Solution for the part 2.
+    Returns all the ways the light can enter the maze from its edges, as a list of (row, col, direction).
     '''
-    max_energized = 0
     max_row = len(maze)-1
     max_col = len(maze[0])-1
-
+    entries = []
     for row in range(max_row+1):
-        max_energized = max(max_energized, n_energized_tiles(maze,  row,        0,  'E'))
-        max_energized = max(max_energized, n_energized_tiles(maze,  row,  max_col,  'W'))
-
+        entries.append((row,        0,  EAST))
+        entries.append((row,  max_col,  WEST))
     for col in range(max_col+1):
-        max_energized = max(max_energized, n_energized_tiles(maze,        0,  col,  'S'))
-        max_energized = max(max_energized, n_energized_tiles(maze,  max_row,  col,  'N'))
+        entries.append((      0,  col,  SOUTH))
+        entries.append((max_row,  col,  NORTH))
+    return entries
+
 
-    return max_energized
+def part2(maze: list) -> int:
+    '''
+    Solution for the part 2.
+    '''
+    # All the entry points share the same beam graph, so the paths are traced only once
+    graph = BeamGraph(maze)
+    return max(graph.n_energized_tiles(row, col, direction) for row, col, direction in entry_points(maze))
 
 # =========================
 
@@ -39,7 +39,7 @@ import argparse
 import collections
 import itertools
 import math
-import copy
+from array import array
 
 
 # Type the path to your input text file here if you do not wish to use the command line argument
@@ -82,34 +82,40 @@ def c2str(coordinates):
     '''
     return f"{coordinates[0]},{coordinates[1]},{coordinates[2]}"
 
+# Value of an empty space in the grid
+EMPTY = -1
+
 class BrickManager:
     '''
     Class stores a collection of bricks and handles their operations.
     '''
     def __init__(self) -> None:
         self.bricks = []    # all bricks in the system
-        self.grid   = []    # a three-dimensional list denoting the (x,y,z) coordinates of the whole system
+        self.grid   = array('i')    # the (x,y,z) coordinates of the whole system, flattened; each space holds the id of the brick in it, or EMPTY
+        self.size_x = 0     # dimensions of the grid
+        self.size_y = 0
+        self.size_z = 0
 
     def new_brick(self, brick):
         '''
-        Method adds the given brick to the list self.bricks
+        Method adds the given brick to the list self.bricks, and gives the brick an id.
         '''
+        brick.id = len(self.bricks)
         self.bricks.append(brick)
 
+    def cell_index(self, x, y, z):
+        '''
+        Method returns the index of the space (x,y,z) in the flattened self.grid.
+        '''
+        return (x*self.size_y + y)*self.size_z + z
+
     def remove_brick(self, brick):
         '''
         Method removes the given brick from the self.grid.
         The method DOES NOT check if the return value of brick.occupies() actually matches the brick's coordinates in self.grid!
         '''
         for x,y,z in brick.occupies():
-            self.grid[x][y][z] = None
-
-    def delete_brick(self, brick):
-        '''
-        Method deletes the brick from the system: it removes the brick from the list self.bricks and from self.grid (with the help of method BrickManager.remove_brick() )
-        '''
-        self.remove_brick(brick)
-        self.bricks.remove(brick)
+            self.grid[self.cell_index(x,y,z)] = EMPTY
 
     def get_extreme_values(self):
         '''
@@ -128,6 +134,21 @@ class BrickManager:
         return (min_x, min_y, min_z, max_x, max_y, max_z)
     
 
+    def snapshot(self):
+        '''
+        Method returns a snapshot of the locations of all bricks, as a list of (x, y, z) tuples in the order of self.bricks.
+        '''
+        return [(brick.x, brick.y, brick.z) for brick in self.bricks]
+
+    def restore(self, snapshot):
+        '''
+        Method restores the locations of all bricks from the given snapshot (see BrickManager.snapshot), and re-creates self.grid.
+        '''
+        for brick, (x, y, z) in zip(self.bricks, snapshot):
+            brick.x, brick.y, brick.z = x, y, z
+        self.construct_grid()
+
+
     def move_brick_to_direction(self, brick, xdelta=0, ydelta=0, zdelta=0):
         '''
         Method TRIES TO move the given brick to the given direction a given amount of steps.
@@ -139,19 +160,17 @@ class BrickManager:
         currently_occupies = brick.occupies()
 
         # Check that the movement is legal
-        try:
-            for x,y,z in currently_occupies:
-                # Check that the resulting space is empty or already contains the brick in question.
-                # The latter check is to allow vertical blocks to still move downwards (and also horizontal bricks to move to horizontal direction);
-                # the brick is allowed to go to a space that the brick itself was already occupying.
-                if self.grid[x+xdelta][y+ydelta][z+zdelta] not in (None, brick): # Raises IndexError if out of bounds
-                    return False
-                # Check that the brick would not be moved below ground level
-                if z+zdelta < 1:
-                    return False
-        except IndexError:
-            return False
-            
+        for x,y,z in currently_occupies:
+            x, y, z = x+xdelta, y+ydelta, z+zdelta
+            # Check that the brick would not be moved outside the grid or below ground level
+            if not (0 <= x < self.size_x and 0 <= y < self.size_y and 1 <= z < self.size_z):
+                return False
+            # Check that the resulting space is empty or already contains the brick in question.
+            # The latter check is to allow vertical blocks to still move downwards (and also horizontal bricks to move to horizontal direction);
+            # the brick is allowed to go to a space that the brick itself was already occupying.
+            if self.grid[self.cell_index(x,y,z)] not in (EMPTY, brick.id):
+                return False
+
         # Remove the brick from the grid
         self.remove_brick(brick)
 
@@ -168,10 +187,12 @@ class BrickManager:
 
     def construct_grid(self):
         '''
-        Method recreates the three-dimensional list self.grid and places all bricks into it.
+        Method recreates the grid self.grid and places all bricks into it.
+        The grid is a flat array of the brick ids, which is far more compact than a three-dimensional list of brick objects.
         '''
         min_x, min_y, min_z, max_x, max_y, max_z = self.get_extreme_values()
-        self.grid= [[[None for z in range(min_z,max_z+3)] for y in range(min_y,max_y+1)] for x in range(min_x, max_x+1)]
+        self.size_x, self.size_y, self.size_z = max_x+1, max_y+1, max_z+2
+        self.grid = array('i', [EMPTY]) * (self.size_x*self.size_y*self.size_z)
         for brick in self.bricks:
             self.place_brick_to_grid(brick)
 
@@ -182,9 +203,21 @@ class BrickManager:
         Raises ValueError if the placement couldn't be completed due to the space already being occupied.
         '''
         for x,y,z in brick.occupies():
-            if self.grid[x][y][z] is not None:
+            idx = self.cell_index(x,y,z)
+            if self.grid[idx] != EMPTY:
                 raise ValueError
-            self.grid[x][y][z] = brick
+            self.grid[idx] = brick.id
+
+
+    def drop_brick(self, brick, drop):
+        '''
+        Method moves the given brick 'drop' steps downwards. Unlike BrickManager.move_brick_to_direction, the method does not check if the
+        movement is legal; it should be used with the values determined in BrickManager.apply_gravity.
+        '''
+        self.remove_brick(brick)
+        brick.z = (brick.z[0]-drop, brick.z[1]-drop)
+        for x,y,z in brick.occupies():
+            self.grid[self.cell_index(x,y,z)] = brick.id
 
 
     def apply_gravity(self):
@@ -193,43 +226,30 @@ class BrickManager:
         '''
         # Re-construct the grid and initialize values
         self.construct_grid()
-        min_x, min_y, min_z, max_x, max_y, max_z = self.get_extreme_values()
-        processed_bricks = []
-        
+
         # Number of brick that moves when applying gravity
         n_would_fall = 0
 
-        # Loop through the grid level by level, from bottom to top, and on each level through all xy-coordinates.
-        # Point is that when starting from bottom, no such problems appear that a brick should be moved twice due to it first hitting another brick but this
-        # supporting brick also moved later.
-        for z in range(min_z, max_z+1):
-            for x,y in itertools.product(list(range(min_x, max_x+1)), list(range(min_y, max_y+1))):
-
-                # Skip if the space is empty
-                if self.grid[x][y][z] is None:
-                    continue
-
-                # Skip if the brick in the space has already been processed
-                if self.grid[x][y][z] in processed_bricks:
-                    continue
-
-                # Collect the brick and apply gravity to the brick
-                brick = self.grid[x][y][z]
-                ret = True
-                counted = False
-
-                # Move the brick downwards until it can no longer be moved (= until self.move_brick_to_direction returns False)
-                while ret:
-                    ret = self.move_brick_to_direction(brick,zdelta=-1)
-                    
-                    # If the brick moved and it was not yet been counted to the total, cont this brick to the total sum
-                    if ret and not counted:
-                        n_would_fall += 1
-                        counted = True
-
-                # Mark this brick as processed (no need to check for gravity again)
-                processed_bricks.append(brick)
-        
+        # Height map: the highest level occupied by an already settled brick in each (x,y) column, or 0 (ground) if there is none
+        heights = array('i', [0]) * (self.size_x*self.size_y)
+
+        # Loop through the bricks from bottom to top, ordered by their lowest level. Point is that when starting from bottom, no such
+        # problems appear that a brick should be moved twice due to it first hitting another brick but this supporting brick also moved later.
+        for brick in sorted(self.bricks, key=lambda brick: brick.z[0]):
+
+            # The brick comes to rest on top of the highest settled brick below its footprint (or on the ground), so it is enough
+            # to look up the height map instead of scanning the spaces below the brick
+            columns = [x*self.size_y + y for x in range(brick.x[0], brick.x[1]+1) for y in range(brick.y[0], brick.y[1]+1)]
+            drop = brick.z[0] - (max(heights[column] for column in columns) + 1)
+
+            # Move the brick downwards directly to where it comes to rest. If the brick moved, count this brick to the total sum
+            if drop > 0:
+                self.drop_brick(brick, drop)
+                n_would_fall += 1
+
+            for column in columns:
+                heights[column] = brick.z[1]
+
         return n_would_fall
 
             
@@ -239,17 +259,23 @@ class Brick:
     Data class holding the location information of a single brick
     '''
     def __init__(self, x0, y0, z0, x1, y1, z1) -> None:
+        self.id = None  # set when the brick is added to a BrickManager
         self.x = (min(int(x0),int(x1)),max(int(x0),int(x1)))
         self.y = (min(int(y0),int(y1)),max(int(y0),int(y1)))
         self.z = (min(int(z0),int(z1)),max(int(z0),int(z1)))
 
+        # The shape of the brick never changes, only its location: the spaces the brick occupies relative to its minimum corner
+        # are computed once, and the absolute coordinates are then just offsets from the current corner
+        self.cells_rel = tuple((dx,dy,dz) for dx in range(self.x[1]-self.x[0]+1) for dy in range(self.y[1]-self.y[0]+1) for dz in range(self.z[1]-self.z[0]+1))
+
     def occupies(self):
         '''
         Returns a list of coordinates where this brick is places.
         All squares where the brick goes through are counted, not just the extremes.
         For example, [(0,0,1),(0,0,2),(0,0,3)]
         '''
-        return [(x,y,z) for x in range(self.x[0], self.x[1]+1) for y in range(self.y[0], self.y[1]+1) for z in range(self.z[0], self.z[1]+1)]
+        x, y, z = self.x[0], self.y[0], self.z[0]
+        return [(x+dx, y+dy, z+dz) for dx,dy,dz in self.cells_rel]
     
     def __repr__(self) -> str:
         return f"{self.z[0]}"
@@ -274,14 +300,44 @@ def verify_gravity(bm):
     Function verifies that gravity is applied correctly, i.e. no brick can be moved downwards. Useful for testing and debugging.
     Returns True if gravity has been applied correctly, False if at least one brick could be moved downwards.
     '''
-    bm_copy = copy.deepcopy(bm)
-    for brick in bm_copy.bricks:
-        ret = bm_copy.move_brick_to_direction(brick, zdelta=-1)
+    # Only the moved brick changes, so the state is restored from a snapshot of the brick coordinates instead of working on a deep copy
+    snapshot = bm.snapshot()
+    for brick in bm.bricks:
+        ret = bm.move_brick_to_direction(brick, zdelta=-1)
         if ret:
+            bm.restore(snapshot)
             return False
     return True
 
 
+def find_supports(bm):
+    '''
+    Function finds out which bricks support which bricks, when gravity has already been applied.
+    Returns a tuple (supports, is_supported_by), where
+        supports[a]={b,c,d} means that brick a supports bricks b, c and d, and
+        is_supported_by[a]={b,c,d} means that brick a is supported by bricks b, c and d.
+    '''
+    bricks_by_id    = {brick.id: brick for brick in bm.bricks}
+    supports        = {brick: set() for brick in bm.bricks}
+    is_supported_by = {brick: set() for brick in bm.bricks}
+
+    # A brick can only be supported by the bricks directly below its bottom face, so only those spaces need to be checked
+    for top in bm.bricks:
+        z = top.z[0] - 1
+        if z < 1:
+            continue
+        for x in range(top.x[0], top.x[1]+1):
+            for y in range(top.y[0], top.y[1]+1):
+                btm = bm.grid[bm.cell_index(x,y,z)]
+
+                # If there is a brick below the bottom face, it supports this brick -> register this to the dictionaries
+                if btm != EMPTY:
+                    btm = bricks_by_id[btm]
+                    supports[btm].add(top)
+                    is_supported_by[top].add(btm)
+
+    return supports, is_supported_by
+
 
 # =========================
 
@@ -290,32 +346,7 @@ def part1(bm) -> int:
     '''
     Solution for the part 1.
     '''
-    min_x, min_y, min_z, max_x, max_y, max_z = bm.get_extreme_values()
-
-    # Maps bricks from supporting brick to bricks it supports: supports[a]=[b,c,d] means that brick a supports bricks b, c and d
-    supports        = {}
-
-    # Maps bricks from supported bricks to bricks they are supported by: is_supported_by[a]=[b,c,d] means that brick a is supported by bricks b, c and d
-    is_supported_by = {}
-
-    # Initialize the dictionaries
-    for brick in bm.bricks:
-        supports[brick]         = []
-        is_supported_by[brick]  = []
-
-    # Loop for every height, starting from bottom
-    for z in range(1, max_z+2):
-        # Loop for all xy-coordinates
-        for x,y in itertools.product(list(range(min_x, max_x+1)),list(range(min_y, max_y+1))):
-            btm = bm.grid[x][y][z-1]
-            top = bm.grid[x][y][z]
-
-            # If there is a brick on coordinates 'btm' and another at 'top', then brick at btm supports the brick at top -> register this to the dictionaries
-            if btm is not None and top is not None and btm != top:
-                if top not in supports[btm]:
-                    supports[btm].append(top)
-                if btm not in is_supported_by[top]:
-                    is_supported_by[top].append(btm)
+    supports, is_supported_by = find_supports(bm)
 
     n_can_be_taken = 0
     
@@ -326,9 +357,7 @@ def part1(bm) -> int:
         # Check through each brick the bottom brick supports.
         # If each of them has at least some other brick supporting it, the bottom brick can safely be removed.
         for top in supports[btm]:
-            tmp = list(is_supported_by[top])
-            tmp.remove(btm)
-            if len(tmp) == 0:
+            if len(is_supported_by[top]) == 1:
                 can_be_taken = False
                 break
         if can_be_taken:
@@ -342,13 +371,21 @@ def part2(bm) -> int:
     '''
     Solution for the part 2.
     '''
+    supports, is_supported_by = find_supports(bm)
     tot = 0
 
-    # Loop through each brick and find how many bricks would fall if this brick were removed
-    for idx in range(len(bm.bricks)):
-        bm_copy = copy.deepcopy(bm)     # deepcopy -> the original stays intact
-        bm_copy.delete_brick(bm_copy.bricks[idx])
-        tot += bm_copy.apply_gravity()
+    # Loop through each brick and find how many bricks would fall if this brick were removed.
+    # Instead of re-applying gravity, the chain reaction is followed along the supports: a brick falls when all the bricks
+    # supporting it have fallen (or been removed). Only bricks supported by a fallen brick can fall next.
+    for removed in bm.bricks:
+        falling = {removed}
+        queue   = collections.deque(supports[removed])
+        while queue:
+            brick = queue.popleft()
+            if brick not in falling and is_supported_by[brick] <= falling:
+                falling.add(brick)
+                queue.extend(supports[brick])
+        tot += len(falling) - 1     # The removed brick itself did not fall
 
     return tot
 
@@ -365,6 +402,4 @@ if  __name__ == "__main__":
     bm.apply_gravity()
 
     print(f"Part 1 solution: {part1(bm)}")
-
-    # The part 2 solution is quite slow, but the time it takes is still reasonable to wait out (around 40 seconds for me)
     print(f"Part 2 solution: {part2(bm)}")
@@ -40,16 +40,24 @@ import collections
 import itertools
 import math
 import queue
+from array import array
 
 
 # Type the path to your input text file here if you do not wish to use the command line argument
 FILENAME = "./inputs/day23.txt"
 
+# The maze is stored as rows of bytes, so the tiles are small integers (character codes) and compared as such
+WALL       = ord('#')
+PATH       = ord('.')
+
 DIRECTIONS = ((-1,0),(1,0),(0,-1),(0,1))
-SLOPES     = {'^': (-1, 0),
-              'v': ( 1, 0),
-              '<': ( 0,-1),
-              '>': ( 0, 1)}
+SLOPES     = {ord('^'): (-1, 0),
+              ord('v'): ( 1, 0),
+              ord('<'): ( 0,-1),
+              ord('>'): ( 0, 1)}
+
+# Translation table from the tiles to 0 (wall) or 1 (any other tile)
+OPEN_TILES = bytes(int(tile != WALL) for tile in range(256))
 
 
 
@@ -69,96 +77,44 @@ def get_fn() ->  str:
 
 def load_file(fn: str)  -> str:
     '''
-    Function loads the contents of the given text file and returns the contents as a string.
+    Function loads the contents of the given text file and returns the non-empty lines as a list of bytes objects.
     @param fn:      path to the file to-be-loaded
-    @returns:       contents of the file as a string
+    @returns:       contents of the file as a list of bytes objects, one per line
     '''
-    with open(fn,'r') as file:
-        ret = ''
-        for line in file:   # Loop through the file and add the lines to the return value
-            ret += line
-    return [line for line in ret.split('\n') if line.strip() != '']
+    with open(fn,'rb') as file:
+        return file.read().split()      # Read the file in one go and split it into the rows; the maze has no spaces, so empty lines are dropped
 
 # =========================
 
 def get_start_coordinates(maze):
-    col = maze[0].index('.')
+    col = maze[0].index(PATH)
     return 0, col
 
 def get_end_coordinates(maze):
-    col = maze[-1].index('.')
+    col = maze[-1].index(PATH)
     return len(maze)-1, col
 
 def maze_object(maze,row,col):
     '''
-    Returns the character in the given coordinates, or None if the coordinates are out of the maze
+    Returns the tile (character code) in the given coordinates, or None if the coordinates are out of the maze
     '''
     if 0 <= row < len(maze) and 0 <= col < len(maze[0]):
         return maze[row][col]
     return None
 
-def find_paths(maze, slippery=True):
-    '''
-    Finds and returns all paths through the maze with abreadth-first search.
-    @param slippery:    True -> the tiles with an arrow (^, >, v, <) can also be gone through to the pointed direction
-                        False -> the arrows are considered to be regular tiles (.) and can be traversed to any direction
-    '''
-    # Initialization
-    q = collections.deque()
-    all_paths = []
-    start_row,  start_col   = get_start_coordinates(maze)
-    end_row,    end_col     = get_end_coordinates(maze)
-
-    # Format in q: each entry has form ((current_row, current_column),path_thus_far), the path_thus_far being a list of (row,col) pairs of the path
-    q.append(((start_row, start_col), [(start_row, start_col)]))
-
-    # Conducting the breadth-first search
-    while len(q) > 0:
-        (row, col), path = q.pop()
-
-        # Reached goal tile -> save to all_paths and continue to next
-        if row == end_row and col == end_col:
-            all_paths.append(list(path))
-            continue
-        
-        # Determine the directions we can go from this tile: if a basic tile or not slippery, any direction is applicable.
-        # If slippery and an slope tile, only applicable direction is the one where the slope is pointing to
-        current_tile = maze_object(maze, row, col)
-        if current_tile in SLOPES and slippery:
-            next_directions = (SLOPES[current_tile],)
-        else:
-            next_directions = DIRECTIONS
-
-        # Loop through each (applicable) direction
-        for direction in next_directions:
-            
-            new_row = row + direction[0]
-            new_col = col + direction[1]
-            new_obj = maze_object(maze, new_row, new_col)
-
-            # Skip if the next tile would either be a wall or out of bounds, or if the tile already exists in the path
-            if new_obj == '#' or new_obj is None:
-                continue
-            if (new_row, new_col) in path:
-                continue
-
-            # Add the new coordinates and path to these coordinates to the que
-            new_path = list(path)
-            new_path.append((new_row, new_col))
-            q.append(((new_row, new_col), new_path))
-
-    return all_paths
-
 
 class Graph:
     '''
     Helper function to reduce the dimensionality of the maze. This is done by denoting all tiles where three or more paths meet as a 'Node', and grouping the tiles
     between two adjacent nodes as a single 'Edge'
+    @param slippery:    True -> the tiles with an arrow (^, >, v, <) can only be gone through to the pointed direction, so some Edges are one-way
+                        False -> the arrows are considered to be regular tiles (.) and all Edges can be traversed to both directions
     '''
-    def __init__(self,maze) -> None:
+    def __init__(self,maze, slippery=False) -> None:
         self.maze = maze
+        self.slippery = slippery
         self.nodes = []
-        self.node_coordinates = {}
+        self.node_coordinates = {}     # (row, col) -> Node in those coordinates
         self.create_nodes()
         self.connect_nodes()
         self.connections = {}
@@ -168,94 +124,103 @@ class Graph:
         '''
         Find the 'nodes' from the maze (i.e. tiles with at least 3 neighbouring tiles, not counting walls)
         '''
+        maze = self.maze
         self.nodes = []
         start_row,  start_col   = get_start_coordinates(maze)
         end_row,    end_col     = get_end_coordinates(maze)
         self.nodes.append(Node(start_row, start_col))
         self.nodes.append(Node(end_row, end_col))
 
-        # Loop through each coordinate in the maze
-        for row, col in itertools.product(list(range(len(maze))), list(range(len(maze[0])))):
-            obj = maze_object(self.maze, row, col)
+        # Translate the maze into rows of 1s (no wall) and 0s (wall), padded with walls on every side. This way, the number of
+        # 'neighbours' of a tile, i.e. tiles that are not walls, is the sum of four bytes, without any bounds checks
+        width   = len(maze[0])
+        padding = bytes(width+2)
+        open_tiles = [padding] + [b'\0' + row.translate(OPEN_TILES) + b'\0' for row in maze] + [padding]
 
-            # Wall -> continue to next
-            if obj == "#":
-                continue
+        # Loop through each coordinate in the maze, with the rows above and below at hand
+        for row in range(len(maze)):
+            above, here, below = open_tiles[row], open_tiles[row+1], open_tiles[row+2]
+            for col in range(1, width+1):
 
-            # Not a wall -> count the number of 'neighbours', i.e. tiles that are not walls (or out of bounds)
-            n_neighbours = 0
-            for direction in DIRECTIONS:
-                neighbour = maze_object(self.maze, row + direction[0], col + direction[1])
-                if neighbour != "#" and neighbour is not None:
-                    n_neighbours += 1
+                # Not a wall, and at least 3 neighbours -> mark this tile as a 'Node'
+                if here[col] and above[col] + below[col] + here[col-1] + here[col+1] >= 3:
+                    self.nodes.append(Node(row, col-1))
 
-            # At least 3 neighbours -> mark this tile as a 'Node'
-            if n_neighbours >= 3:
-                self.nodes.append(Node(row, col))
-        
         # Collect the coordinates for each Node
         for node in self.nodes:
-            self.node_coordinates[f"{node.row},{node.col}"] = node
+            self.node_coordinates[(node.row, node.col)] = node
 
     def is_node(self, row, col):
         '''
         Returns True if there is a Node in the given coordinates, False if not
         '''
-        return f"{row},{col}" in self.node_coordinates
+        return (row, col) in self.node_coordinates
     
     def node_in(self, row, col):
         '''
         Returns the Node object that lies in the given coordinates
         '''
-        return self.node_coordinates[f"{row},{col}"]
+        return self.node_coordinates[(row, col)]
 
     def connect_nodes(self):
         '''
         Method 'connects' the Nodes in the Graph: it finds the number of tiles between these two Nodes and froups the as a single Edge
+        If the Graph is slippery, an Edge is only created to the directions it can be traversed to.
         '''
+        maze = self.maze
         self.edges = []
 
         # Method: Iterate through each node. Start going to all directions from this node (obviously stopping at walls) and find the node where this path connects to.
         for node, direction in itertools.product(self.nodes, DIRECTIONS):
-            path = [[node.row, node.col]]
+            path = array('h', (node.row, node.col))    # The tiles of the path as a flat array of row, col pairs: [row0, col0, row1, col1, ...]
 
             # First: Find if this direction is applicable in the first place (there is not a wall in the very next tile starting from the Node)
             row, col = node.row + direction[0], node.col + direction[1]
-            next_obj = maze_object(self.maze, row, col)
-            if next_obj in ('#', None):
+            next_obj = maze_object(maze, row, col)
+            if next_obj in (WALL, None):
                 continue
 
             # Follow the path until either another Node is found, or the path hits a dead end
-            path.append([row, col])
+            path.extend((row, col))
+            prev_row, prev_col = node.row, node.col
+            traversable = True
             while not self.is_node(row, col):
                 for d in DIRECTIONS:
                     next_row, next_col = row + d[0], col + d[1]
-                    next_obj = maze_object(self.maze, next_row, next_col)
+                    next_obj = maze_object(maze, next_row, next_col)
                     
-                    # Find the "correct" direction, that is, the only direction which is not already in the path and which is not a wall
-                    if next_obj not in ('#', None) and [next_row, next_col] not in path:
+                    # Find the "correct" direction, that is, the only direction which is not a wall and which does not lead back.
+                    # Between the Nodes, the paths are one tile wide, so the only tile of the path next to this one is the previous tile
+                    if next_obj not in (WALL, None) and (next_row, next_col) != (prev_row, prev_col):
                         break
+
+                # On a slippery slope, the path can only continue to the direction the slope is pointing to
+                obj = maze_object(maze, row, col)
+                if self.slippery and obj in SLOPES and SLOPES[obj] != d:
+                    traversable = False
+                    break
                 
-                path.append([next_row, next_col])
+                path.extend((next_row, next_col))
+                prev_row, prev_col = row, col
                 row, col = next_row, next_col
 
-            # Construct an Edge between the two Nodes
+            # Skip the path if it cannot be traversed to this direction
+            if not traversable:
+                continue
+
+            # Construct an Edge between the two Nodes. If several paths connect the same two Nodes, keep only the longest of them
             other_node = self.node_in(row,col)
-            e = Edge(node, other_node, len(path)-1, path)
-            node.connects_to[other_node] = e
+            e = Edge(node, other_node, len(path)//2 - 1, path)
+            if other_node not in node.connects_to or node.connects_to[other_node].weight < e.weight:
+                node.connects_to[other_node] = e
             self.edges.append(e)
 
 
-    def path_length(self, path):
-        length = 0
-        for first, second in zip(path[:-1], path[1:]):
-            length += first.connects_to[second].weight
-        return length
-
     def find_longest_path(self):
         '''
         Method finds the longest path in the graph and returns its length
         '''
+        maze = self.maze
         start_row,  start_col   = get_start_coordinates(maze)
         end_row,    end_col     = get_end_coordinates(maze)
         
@@ -263,25 +228,27 @@ class Graph:
         goal  = self.node_in(end_row, end_col)
 
 
-        q = collections.deque()
-        q.append([start])
+        # Refer to the nodes with their indices in self.nodes, and collect the neighbours of each node as (neighbour_index, edge_weight) pairs
+        node_ids    = {node: idx for idx, node in enumerate(self.nodes)}
+        neighbours  = [[(node_ids[next_node], next_edge.weight) for next_node, next_edge in node.connects_to.items()] for node in self.nodes]
+        goal_id     = node_ids[goal]
+
+        # Format in the stack: each entry has form (current_node_index, visited_nodes, path_length_thus_far), where visited_nodes is a bitmask
+        # with bit n set if the node n is already in the path
+        stack = [(node_ids[start], 1 << node_ids[start], 0)]
 
         longest_path_length = 0
 
-        # Conduct a breadth-first search to iterate through all paths, and keep track of the longest found path
-        while len(q) > 0:
-            path = q.pop()
-            node = path[-1]
-            if node == goal:
-                length = self.path_length(path)
+        # Conduct a depth-first search to iterate through all paths, and keep track of the longest found path
+        while stack:
+            node_id, visited, length = stack.pop()
+            if node_id == goal_id:
                 longest_path_length = max(longest_path_length, length)
                 continue
-            for next_node, next_edge in node.connects_to.items():
-                if next_node in path:
+            for next_id, weight in neighbours[node_id]:
+                if visited & (1 << next_id):
                     continue
-                new_path = list(path)
-                new_path.append(next_node)
-                q.append(new_path)
+                stack.append((next_id, visited | (1 << next_id), length + weight))
 
         return longest_path_length
 
@@ -302,13 +269,14 @@ class Node:
 
 class Edge:
     '''
-    Data class holding information about the Edge between two Nodes
+    Data class holding information about the Edge between two Nodes.
+    The tiles of the Edge are stored in 'path' as a flat array of row, col pairs.
     '''
-    def __init__(self,first_node, second_node ,weight, path=[]) -> None:
+    def __init__(self,first_node, second_node ,weight, path=None) -> None:
         self.first = first_node
         self.second = second_node
         self.weight= weight
-        self.path = path
+        self.path = path if path is not None else array('h')
 
     def __repr__(self) -> str:
         return f"{self.first}->{self.second};{self.weight}"
@@ -319,10 +287,9 @@ def part1(maze: list) -> int:
     '''
     Solution for the part 1.
     '''
-    all_paths = find_paths(maze, slippery=True)
-    all_paths.sort(key=lambda path: len(path))
-
-    return len(all_paths[-1])-1
+    g = Graph(maze, slippery=True)
+    length = g.find_longest_path()
+    return length
 
 
 def part2(maze: list) -> int: